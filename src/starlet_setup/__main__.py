@@ -18,7 +18,7 @@ def main() -> None:
   args = parse_args()
 
   if args.init_config:
-    create_default_config()
+    create_default_config(args.yes)
     return
   if args.list_configs:
     list_configs(args.config)
@@ -33,19 +33,19 @@ def main() -> None:
       'verbose': args.verbose,
       'cmake_arg': args.cmake_arg or []
     }
-    add_config(args.config, args.config_add, new_config)
+    add_config(args.config, args.config_add, new_config, args.config_path, args.yes)
     return
   if args.config_remove:
-    remove_config(args.config, args.config_remove)
+    remove_config(args.config, args.config_remove, args.config_path, args.yes)
     return
   if args.list_profiles:
     list_profiles(args.config)
     return
   if args.profile_add:
-    add_profile(args.config, args.profile_add)
+    add_profile(args.config, args.profile_add, args.config_path, args.yes)
     return
   if args.profile_remove:
-    remove_profile(args.config, args.profile_remove)
+    remove_profile(args.config, args.profile_remove, args.config_path, args.yes)
     return
 
   if not args.repo:
@@ -1,27 +1,61 @@
 """Command-line argument parsing."""
 
+import sys
 import argparse
 from argparse import Namespace
 from typing import Any
 from .config import get_config_value, load_config
 
+_HELP_FLAGS = {'-h', '--help'}
 
-def _add_common_args(
-  parser, 
-  config: dict[str, Any]
-) -> None:
+
+def _resolved_defaults(config: dict[str, Any]) -> dict[str, Any]:
+  """
+  Resolve argument defaults from the loaded config in one pass.
+
+  Args:
+    config: Configuration dictionary
+
+  Returns:
+    Mapping of argument names to their default values
+  """
+  defaults = get_config_value(config, 'configs.default', {})
+  if not isinstance(defaults, dict):
+    defaults = {}
+  return {
+    'ssh': defaults.get('ssh', False),
+    'full_clone': defaults.get('full_clone', False),
+    'verbose': defaults.get('verbose', False),
+    'build_type': defaults.get('build_type', 'Debug'),
+    'build_dir': defaults.get('build_dir', 'build'),
+    'no_build': defaults.get('no_build', False),
+    'mono_dir': defaults.get('mono_dir', 'build-mono'),
+    'jobs': defaults.get('jobs', 4),
+  }
+
+
+def _add_common_args(parser) -> None:
   parser.add_argument(
     '--ssh',
     action='store_true',
-    default=get_config_value(config, 'configs.default.ssh', False),
     help='Use SSH instead of HTTPS for cloning'
   )
   parser.add_argument(
     '-v', '--verbose',
     action='store_true',
-    default=get_config_value(config, 'configs.default.verbose', False),
     help='Show detailed command output'
   )
+  parser.add_argument(
+    '--full-clone',
+    action='store_true',
+    help='Clone full history instead of the default shallow blobless clone'
+  )
+  parser.add_argument(
+    '-y', '--yes',
+    action='store_true',
+    default=False,
+    help='Assume yes for confirmation prompts (for scripted use)'
+  )
   parser.add_argument(
     '--cmake-arg',
     action='append',
@@ -72,22 +106,19 @@ def _add_profile_management_args(parser) -> None:
   )
 
 
-def _add_build_args(parser, config: dict[str, Any]) -> None:
+def _add_build_args(parser) -> None:
   parser.add_argument(
     '-b', '--build-type',
     choices=['Debug', 'Release', 'RelWithDebInfo', 'MinSizeRel'],
-    default=get_config_value(config, 'configs.default.build_type', 'Debug'),
     help='CMake build type (default: %(default)s)'
   )
   parser.add_argument(
     '-d', '--build-dir',
-    default=get_config_value(config, 'configs.default.build_dir', 'build'),
     help='Build directory name (default: %(default)s)'
   )
   parser.add_argument(
     '-n', '--no-build',
     action='store_true',
-    default=get_config_value(config, 'configs.default.no_build', False),
     help='Skip building, only configure'
   )
   parser.add_argument(
@@ -98,7 +129,7 @@ def _add_build_args(parser, config: dict[str, Any]) -> None:
   )
 
 
-def _add_mono_repo_args(parser, config: dict[str, Any]) -> None:
+def _add_mono_repo_args(parser) -> None:
   parser.add_argument(
     '--mono-repo',
     action='store_true',
@@ -106,9 +137,14 @@ def _add_mono_repo_args(parser, config: dict[str, Any]) -> None:
   )
   parser.add_argument(
     '--mono-dir',
-    default=get_config_value(config, 'configs.default.mono_dir', 'build-mono'),
     help='Directory name for mono-repo cloning (default: %(default)s)'
   )
+  parser.add_argument(
+    '-j', '--jobs',
+    type=int,
+    metavar='N',
+    help='Parallel clone workers in mono-repo mode (default: %(default)s)'
+  )
   parser.add_argument(
     '--repos',
     nargs='+',
@@ -128,10 +164,16 @@ def parse_args() -> Namespace:
   """
   Parse command-line arguments for Starlet Setup.
 
+  Config loading is skipped entirely when only help is requested, since
+  argparse exits before any default would be used.
+
   Returns:
     Parsed arguments namespace
   """
-  config, config_path = load_config()
+  if _HELP_FLAGS.isdisjoint(sys.argv[1:]):
+    config, config_path = load_config()
+  else:
+    config, config_path = {}, None
 
   parser = argparse.ArgumentParser(
     description="Starlet Setup - Quick setup script for CMake projects",
@@ -175,11 +217,12 @@ Examples:
     nargs='?',
     help='Repository name (username/repo) or full GitHub URL'
   )
-  _add_common_args(parser, config)
+  _add_common_args(parser)
   _add_config_management_args(parser)
   _add_profile_management_args(parser)
-  _add_build_args(parser, config)
-  _add_mono_repo_args(parser, config)
+  _add_build_args(parser)
+  _add_mono_repo_args(parser)
+  parser.set_defaults(**_resolved_defaults(config))
 
   args = parser.parse_args()
   args.config = config
@@ -195,4 +238,4 @@ Examples:
   if args.repos or args.profile:
     args.mono_repo = True
 
-  return args
\ No newline at end of file
+  return args
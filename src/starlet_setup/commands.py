@@ -1,18 +1,22 @@
 """Command handlers for single and mono-repo modes."""
 
+import os
 import sys
 import shutil
 from argparse import Namespace
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Optional
 from .repository import (
-  resolve_repo_url, 
-  get_default_repos, 
+  resolve_repo_url,
+  get_default_repos,
   clone_repository,
+  git_clone_command,
+  git_env,
 )
 from .config import get_config_value
 from .profiles import list_profiles
-from .utils import run_command
+from .utils import find_tool, run_command
 
 
 def _print_mode_header(
@@ -57,6 +61,50 @@ def _print_mode_header(
   print()
 
 
+def _cmake_generator_args() -> list[str]:
+  """
+  Pick generator arguments for cmake configure.
+
+  Returns:
+    ['-G', 'Ninja'] when Ninja is installed, else [] for the default
+  """
+  if find_tool('ninja'):
+    return ['-G', 'Ninja']
+  return []
+
+
+def _cmake_launcher_args() -> list[str]:
+  """
+  Wire up a compiler cache for cmake configure when one is installed.
+
+  Returns:
+    C and CXX compiler launcher definitions for ccache/sccache, else []
+  """
+  for launcher in ('ccache', 'sccache'):
+    if find_tool(launcher):
+      return [
+        f'-DCMAKE_C_COMPILER_LAUNCHER={launcher}',
+        f'-DCMAKE_CXX_COMPILER_LAUNCHER={launcher}'
+      ]
+  return []
+
+
+def _cmake_build_command(build_type: Optional[str] = None) -> list[str]:
+  """
+  Build the cmake --build command, parallelized across CPU cores.
+
+  Args:
+    build_type: Build configuration for multi-config generators
+
+  Returns:
+    Command and arguments as list
+  """
+  build_cmd = ['cmake', '--build', '.', '--parallel', str(os.cpu_count() or 1)]
+  if build_type:
+    build_cmd.extend(['--config', build_type])
+  return build_cmd
+
+
 def single_repo_mode(args: Namespace) -> None:
   """
   Handle single repository setup.
@@ -66,33 +114,38 @@ def single_repo_mode(args: Namespace) -> None:
     config: configuration dictionary
   """
   repo_url = resolve_repo_url(args.repo, args.ssh)
-  repo_name = Path(repo_url).stem.replace('.git', '')
+  repo_name = repo_url.rpartition('/')[2].removesuffix('.git')
+  repo_dir = Path(repo_name)
+  reference = get_config_value(args.config, 'configs.default.reference_dir', None)
 
   _print_mode_header(
     mode="Single Repository Mode",
     repo_name=repo_name,
     use_ssh=args.ssh
   )
-  
-  if Path(repo_name).exists():
+
+  if repo_dir.is_dir():
     print(f"Repository {repo_name} already exists")
-    if input("Update existing repository? (y/n): ").lower() == 'y':
+    if args.yes or input("Update existing repository? (y/n): ").lower() == 'y':
       print(f"Updating {repo_name}\n")
-      run_command(['git', 'pull'], cwd=repo_name, verbose=args.verbose)
+      run_command(['git', 'pull'], cwd=repo_dir, verbose=args.verbose, env=git_env())
   else:
     print(f"Cloning {repo_name}\n")
-    run_command(['git', 'clone', repo_url], verbose=args.verbose)
-  
-  build_path = Path(repo_name) / args.build_dir
-  if args.clean and build_path.exists():
-    print("Cleaning build directory\n")
-    shutil.rmtree(build_path)
+    run_command(git_clone_command(repo_url, reference, args.full_clone), verbose=args.verbose, env=git_env())
+
+  build_path = repo_dir / args.build_dir
+  if args.clean:
+    try:
+      shutil.rmtree(build_path)
+      print("Cleaning build directory\n")
+    except FileNotFoundError:
+      pass
 
   print(f"Creating build directory: {args.build_dir}\n")
   build_path.mkdir(exist_ok=True)
 
   print("Configuring with CMake\n")
-  cmake_cmd = ['cmake', '..', f'-DCMAKE_BUILD_TYPE={args.build_type}']
+  cmake_cmd = ['cmake', '..', f'-DCMAKE_BUILD_TYPE={args.build_type}', *_cmake_generator_args(), *_cmake_launcher_args()]
   cmake_arg = args.cmake_arg if args.cmake_arg is not None else get_config_value(args.config, 'defaults.cmake_arg', [])
   if cmake_arg:
     cmake_cmd.extend(cmake_arg)
@@ -100,27 +153,14 @@ def single_repo_mode(args: Namespace) -> None:
 
   if not args.no_build:
     print("Building project\n")
-    build_cmd = ['cmake', '--build', '.']
-    if args.build_type:
-      build_cmd.extend(['--config', args.build_type])
-    run_command(build_cmd, cwd=build_path, verbose=args.verbose)
+    run_command(_cmake_build_command(args.build_type), cwd=build_path, verbose=args.verbose)
 
   print(f"Project finished in {repo_name}/{args.build_dir}")
 
 
-def _create_mono_repo_cmakelists(mono_dir: Path, test_repo: str, repos: list[str]):
-  """
-  Create a root CMakeLists.txt for the mono-repo.
-
-  Args:
-    repo_dir: Directory containing all cloned repos
-    test_repo: Test repository name
-    repos: List of all repository paths that were cloned
-  """
-  module_names = [repo.split('/')[-1] for repo in repos]
-  modules_cmake = '\n  '.join(module_names)
-
-  cmake_content = f"""cmake_minimum_required(VERSION 3.23)
+# Template for the root CMakeLists.txt; built once at import time so
+# generating the file is a single str.format plus one write.
+_MONO_CMAKELISTS_TEMPLATE = """cmake_minimum_required(VERSION 3.23)
 
 # Config
 project(starlet_dev LANGUAGES CXX)
@@ -130,8 +170,8 @@ if(NOT EXISTS "${{CMAKE_CURRENT_SOURCE_DIR}}/{test_repo}/CMakeLists.txt")
   message(FATAL_ERROR "Test repository '{test_repo}' not found")
 endif()
 
-set(MONO_REPO_MODULES 
-  {modules_cmake}
+set(MONO_REPO_MODULES
+  {modules}
 )
 
 foreach(module IN LISTS MONO_REPO_MODULES)
@@ -151,6 +191,22 @@ string(REPLACE "-" "_" target "{test_repo}")
 set_property(DIRECTORY ${{CMAKE_CURRENT_SOURCE_DIR}} PROPERTY VS_STARTUP_PROJECT ${{target}})
 """
 
+
+def _create_mono_repo_cmakelists(mono_dir: Path, test_repo: str, repos: list[str]):
+  """
+  Create a root CMakeLists.txt for the mono-repo.
+
+  Args:
+    repo_dir: Directory containing all cloned repos
+    test_repo: Test repository name
+    repos: List of all repository paths that were cloned
+  """
+  modules_cmake = '\n  '.join(repo.rpartition('/')[2] for repo in repos)
+  cmake_content = _MONO_CMAKELISTS_TEMPLATE.format(
+    test_repo=test_repo,
+    modules=modules_cmake
+  )
+
   cmake_file = mono_dir / "CMakeLists.txt"
   cmake_file.write_text(cmake_content)
   print(f"Created root CMakeLists.txt at {mono_dir}\n")
@@ -165,7 +221,7 @@ def mono_repo_mode(args: Namespace):
   """
   test_repo_input = args.repo
 
-  if test_repo_input.startswith('http') or test_repo_input.startswith('git@'):
+  if test_repo_input.startswith(('http', 'git@')):
     if 'github.com/' in test_repo_input or 'github.com:' in test_repo_input:
       parts = test_repo_input.split('/')[-2:]
       test_repo = f"{parts[0].split(':')[-1]}/{parts[1].replace('.git', '')}"
@@ -178,7 +234,7 @@ def mono_repo_mode(args: Namespace):
     print("Error: Repository must be in format 'username/repo' for mono-repo mode")
     sys.exit(1)
 
-  test_repo_name = test_repo.split('/')[-1]
+  test_repo_name = test_repo.rpartition('/')[2]
 
   if args.profile:
     profiles = get_config_value(args.config, 'profiles', {})
@@ -224,8 +280,9 @@ def mono_repo_mode(args: Namespace):
       lib_count=len(repos)
     )
 
-  if test_repo not in repos:
-    repos.append(test_repo)
+  # Deduplicate via dict keys (ordered, O(1) membership) and make sure
+  # the test repo itself gets cloned.
+  repos = list(dict.fromkeys([*repos, test_repo]))
 
   print(f"Total repositories: {len(repos)}\n")
 
@@ -234,10 +291,18 @@ def mono_repo_mode(args: Namespace):
   mono_repo_path.mkdir(exist_ok=True)
 
   print("Cloning repositories")
-  for repo in repos:
+  reference = get_config_value(args.config, 'configs.default.reference_dir', None)
+  with ThreadPoolExecutor(max_workers=min(len(repos), max(args.jobs, 1))) as executor:
+    futures = [
+      executor.submit(clone_repository, repo, mono_repo_path, args.ssh, args.verbose, reference, args.full_clone)
+      for repo in repos
+    ]
     try:
-      clone_repository(repo, mono_repo_path, args.ssh, args.verbose)
+      for future in as_completed(futures):
+        future.result()
     except SystemExit:
+      for future in futures:
+        future.cancel()
       sys.exit(1)
   print(f"\n  Finished cloning ({len(repos)} repositories)\n")
   
@@ -249,7 +314,7 @@ def mono_repo_mode(args: Namespace):
   build_path.mkdir(exist_ok=True)
   
   print(f"Configuring with CMake in {build_path}\n")
-  cmake_cmd = ['cmake', '-DBUILD_LOCAL=ON', '..']
+  cmake_cmd = ['cmake', '-DBUILD_LOCAL=ON', '..', *_cmake_generator_args(), *_cmake_launcher_args()]
   cmake_arg = args.cmake_arg if args.cmake_arg is not None else get_config_value(args.config, 'defaults.cmake_arg', [])
   if cmake_arg:
     cmake_cmd.extend(cmake_arg)
@@ -257,7 +322,7 @@ def mono_repo_mode(args: Namespace):
 
   if not args.no_build:
     print("Building project\n")
-    run_command(['cmake', '--build', '.'], cwd=build_path, verbose=args.verbose)
+    run_command(_cmake_build_command(), cwd=build_path, verbose=args.verbose)
 
   print("Setup complete")
   print(f"Repositories in: {mono_repo_path.absolute()}")
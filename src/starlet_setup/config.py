@@ -2,14 +2,24 @@
 
 import sys
 import json
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
+try:
+  import orjson
+except ImportError:
+  orjson = None
 
+
+@lru_cache(maxsize=1)
 def load_config() -> tuple[dict, Path | None]:
   """
   Load configuration from file, falling back to defaults.
-  
+
+  The result is cached so repeated calls within one run skip the
+  filesystem lookup and JSON decode.
+
   Returns:
     Configuration dictionary, empty dict if not config found
   """
@@ -20,22 +30,25 @@ def load_config() -> tuple[dict, Path | None]:
 
   invalid_count = 0
   for config_path in config_locations:
-    if config_path.exists():
-      try:
-        with open(config_path) as f:
-          return json.load(f), config_path
-      except json.JSONDecodeError as e:
-        print(f"Warning: Invalid JSON in {config_path}: {e}")
-        invalid_count += 1
-        continue
-      except PermissionError:
-        print(f"Error: No permission to read the file in {config_path}.")
-        invalid_count += 1
-        continue
-      except Exception as e:
-        print(f"An unexpected error occurred reading {config_path}: {e}")
-        invalid_count += 1
-        continue
+    try:
+      data = config_path.read_bytes()
+      if orjson is not None:
+        return orjson.loads(data), config_path
+      return json.loads(data), config_path
+    except FileNotFoundError:
+      continue
+    except json.JSONDecodeError as e:
+      print(f"Warning: Invalid JSON in {config_path}: {e}")
+      invalid_count += 1
+      continue
+    except PermissionError:
+      print(f"Error: No permission to read the file in {config_path}.")
+      invalid_count += 1
+      continue
+    except Exception as e:
+      print(f"An unexpected error occurred reading {config_path}: {e}")
+      invalid_count += 1
+      continue
 
 
   if invalid_count != 0:
@@ -62,8 +75,10 @@ def save_config(
     config_path = Path('.starlet-setup.json')
   
   try:
-    with open(config_path, 'w') as f:
-      json.dump(config, f, indent=2)
+    if orjson is not None:
+      config_path.write_bytes(orjson.dumps(config, option=orjson.OPT_INDENT_2))
+    else:
+      config_path.write_text(json.dumps(config, indent=2))
   except PermissionError:
     print(f"Error: No permission to write to {config_path}")
     raise
@@ -73,9 +88,15 @@ def save_config(
   return config_path
 
 
+@lru_cache(maxsize=None)
+def _split_key(key: str) -> tuple[str, ...]:
+  """Split a dot-separated key path, caching the result for hot keys."""
+  return tuple(key.split('.'))
+
+
 def get_config_value(
-  config: dict[str, Any], 
-  key: str, 
+  config: dict[str, Any],
+  key: str,
   default: Any
 ) -> Any:
   """
@@ -86,7 +107,7 @@ def get_config_value(
     key: Dot-separated key path (e.g, 'configs.default.ssh')
     default: Default value if key not found
   """
-  parts = key.split('.')
+  parts = _split_key(key)
   value = config
   for part in parts:
     if not isinstance(value, dict) or part not in value:
@@ -95,8 +116,13 @@ def get_config_value(
   return value
 
 
-def create_default_config() -> None:
-  """Create a default configuration file."""
+def create_default_config(assume_yes: bool = False) -> None:
+  """
+  Create a default configuration file.
+
+  Args:
+    assume_yes: Skip the overwrite confirmation prompt
+  """
   default_config = {
     "configs": {
       "default": {
@@ -124,19 +150,15 @@ def create_default_config() -> None:
 
   config_path = Path('.starlet-setup.json')
 
-  if config_path.exists():
+  if config_path.is_file() and not assume_yes:
     if input(f"{config_path} already exists. Overwrite? (y/n): ").lower() != 'y':
       print("Aborted.")
       return
 
   try:
-    with open(config_path, 'w') as f:
-      json.dump(default_config, f, indent=2)
-  except PermissionError:
-    print(f"Error: No permission to write to {config_path}")
-    return
-  except Exception as e:
-    print(f"An unexpected error occurred writing {config_path}: {e}")
+    save_config(default_config, config_path)
+  except Exception:
+    # save_config already reported the failure
     return
 
   print(f"Created config file: {config_path.absolute()}")
@@ -147,9 +169,11 @@ def create_default_config() -> None:
 
 
 def add_config(
-  config: dict[str, Any], 
+  config: dict[str, Any],
   name: str,
-  new_config: dict[str, Any]
+  new_config: dict[str, Any],
+  config_path: Path | None = None,
+  assume_yes: bool = False
 ) -> None:
   """
   Add a new config to the configuration.
@@ -157,19 +181,21 @@ def add_config(
   Args:
     config: Configuration dictionary
     config_name: Configuration name
+    config_path: File the config was loaded from, rewritten in place
+    assume_yes: Skip the overwrite confirmation prompt
   """
   if 'configs' not in config:
     config['configs'] = {}
 
   if name in config['configs']:
     print(f"Warning: Configuration '{name}' already exists.")
-    if input("Overwrite? (y/n): ").lower() != 'y':
+    if not assume_yes and input("Overwrite? (y/n): ").lower() != 'y':
       print("Aborted.")
       return
     
   config['configs'][name] = new_config
 
-  config_path = save_config(config)
+  config_path = save_config(config, config_path)
 
   config_new = config['configs'][name]
   print(f"Configuration '{name} added successfully to {config_path}")
@@ -193,7 +219,9 @@ def add_config(
 
 def remove_config(
   config: dict[str, Any],
-  name: str
+  name: str,
+  config_path: Path | None = None,
+  assume_yes: bool = False
 ) -> None:
   """
   Remove a config from the configuration.
@@ -201,6 +229,8 @@ def remove_config(
   Args:
     config: Configuration dictionary
     name: Config name to remove
+    config_path: File the config was loaded from, rewritten in place
+    assume_yes: Skip the removal confirmation prompt
   """
   if 'configs' not in config or name not in config['configs']:
     print(f"\nWarning: Config '{name}' not found.\n")
@@ -216,12 +246,12 @@ def remove_config(
   print(f"  No-build flag: {config_new.get('no_build')}")
   print(f"  Verbose flag: {config_new.get('verbose')}")
 
-  if input("\nAre you sure you want to remove this config? (y/n): ").lower() != 'y':
+  if not assume_yes and input("\nAre you sure you want to remove this config? (y/n): ").lower() != 'y':
     print("Aborted.")
     return
 
   del config['configs'][name]
-  config_path = save_config(config)
+  config_path = save_config(config, config_path)
   print(f"\nConfig '{name}' was successfully removed")
   print(f"Configuration saved to: {config_path}\n")
 
@@ -2,6 +2,9 @@
 
 from argparse import Namespace
 
+# Valid answers for the numbered menus, shared by the prompt loops.
+_MENU_CHOICES = ('1', '2')
+
 
 def _ask(prompt: str) -> str:
   """Basic prompt wrapper"""
@@ -42,13 +45,13 @@ def interactive_mode(args: Namespace) -> Namespace:
 
   if not args.mono_repo:
     mode = ''
-    while mode not in ('1', '2'):
+    while mode not in _MENU_CHOICES:
       mode = _ask("Selected mode: (1) Single Repo (2) Mono-Repo")
     args.mono_repo = (mode == '2')
 
   if args.mono_repo and not args.profile and not args.repos:
     choice = ''
-    while choice not in ('1', '2'):
+    while choice not in _MENU_CHOICES:
       choice = _ask("Mono-repo: (1) Use profile (2) Manual repo list")
   
     if choice == '1':
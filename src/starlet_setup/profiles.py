@@ -7,8 +7,10 @@ from .config import get_config_value, save_config
 
 
 def add_profile(
-  config: dict[str, Any], 
-  args_list: list[str]
+  config: dict[str, Any],
+  args_list: list[str],
+  config_path: Path | None = None,
+  assume_yes: bool = False
 ) -> None:
   """
   Add a new profile to the configuration.
@@ -16,9 +18,11 @@ def add_profile(
   Args:
     config: Configuration dictionary
     args_list: [name, repo1, repo2, ...]
+    config_path: File the config was loaded from, rewritten in place
+    assume_yes: Skip the overwrite confirmation prompt
 
   Raises:
-    SystemExit: If insufficient arguments provided  
+    SystemExit: If insufficient arguments provided
   """
   if len(args_list) < 2:
     print("Error: --profile-add requires NAME REPO1 [REPO2 ...]")
@@ -32,13 +36,13 @@ def add_profile(
 
   if name in config['profiles']:
     print(f"Warning: Profile '{name}' already exists.")
-    if input("Overwrite? (y/n): ").lower() != 'y':
+    if not assume_yes and input("Overwrite? (y/n): ").lower() != 'y':
       print("Aborted.")
       return
     
   config['profiles'][name] = repos
 
-  config_path = save_config(config)
+  config_path = save_config(config, config_path)
   print(f"Profile '{name}' added successfully")
   print(f"Configuration saved to: {config_path}")
   print(f"Profile details:")
@@ -49,8 +53,10 @@ def add_profile(
 
 
 def remove_profile(
-  config: dict[str, Any], 
-  name: str
+  config: dict[str, Any],
+  name: str,
+  config_path: Path | None = None,
+  assume_yes: bool = False
 ) -> None:
   """
   Remove a profile from the configuration.
@@ -58,6 +64,8 @@ def remove_profile(
   Args:
     config: Configuration dictionary
     name: Profile name to remove
+    config_path: File the config was loaded from, rewritten in place
+    assume_yes: Skip the removal confirmation prompt
   """
   if 'profiles' not in config or name not in config['profiles']:
     print(f"Warning: Profile '{name}' not found.")
@@ -69,12 +77,12 @@ def remove_profile(
   for repo in repos:
     print(f"    - {repo}")
 
-  if input("\nAre you sure you want to remove this profile? (y/n): ").lower() != 'y':
+  if not assume_yes and input("\nAre you sure you want to remove this profile? (y/n): ").lower() != 'y':
     print("Aborted.")
     return
   
   del config['profiles'][name]
-  config_path = save_config(config)
+  config_path = save_config(config, config_path)
   print(f"\nProfile '{name}' removed successfully")
   print(f"Configuration saved to: {config_path}\n")
 
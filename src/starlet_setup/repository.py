@@ -1,10 +1,66 @@
 """Repository functions including cloning and URL resolution"""
 
+import os
+import sys
+from functools import lru_cache
 from pathlib import Path
 from .config import get_config_value
 from .utils import run_command
 
 
+@lru_cache(maxsize=1)
+def git_env() -> dict[str, str]:
+  """
+  Environment for git subprocesses, built once and shared.
+
+  GIT_TERMINAL_PROMPT is disabled so a repo that needs credentials fails
+  immediately instead of hanging a batch clone on a hidden prompt, and
+  locale variables are pinned to C so git skips message-catalog loading
+  at startup.
+
+  Returns:
+    Environment mapping for git invocations
+  """
+  env = {
+    key: value for key, value in os.environ.items()
+    if not key.startswith('LC_') and key not in ('LANG', 'LANGUAGE')
+  }
+  env['LC_ALL'] = 'C'
+  env['GIT_TERMINAL_PROMPT'] = '0'
+  return env
+
+
+# Default clone flags: shallow, blobless clones cut network transfer to
+# roughly the checked-out tree, which is all the build needs; skipping
+# tags keeps ref negotiation to the single branch being fetched.
+_CLONE_FLAGS = ['--depth=1', '--filter=blob:none', '--no-tags', '--single-branch']
+
+
+def git_clone_command(
+  repo_url: str,
+  reference: str | None = None,
+  full: bool = False
+) -> list[str]:
+  """
+  Build the git clone command for a repository URL.
+
+  Args:
+    repo_url: Full repository URL to clone
+    reference: Local mirror to borrow objects from, if configured
+    full: Clone full history instead of the default shallow clone
+
+  Returns:
+    Command and arguments as list
+  """
+  cmd = ['git', 'clone'] if full else ['git', 'clone', *_CLONE_FLAGS]
+  if reference:
+    # --reference-if-able silently ignores a missing or stale mirror.
+    cmd.extend(['--reference-if-able', reference])
+  cmd.append(repo_url)
+  return cmd
+
+
+@lru_cache(maxsize=None)
 def resolve_repo_url(repo_input: str, use_ssh: bool=False) -> str:
   """
   Convert repository input to full URL.
@@ -16,7 +72,7 @@ def resolve_repo_url(repo_input: str, use_ssh: bool=False) -> str:
   Returns:
     Full repository URL
   """
-  if repo_input.startswith('http') or repo_input.startswith('git@'):
+  if repo_input.startswith(('http', 'git@')):
     return repo_input
 
   if use_ssh:
@@ -51,10 +107,12 @@ def get_default_repos(config: dict) -> list[str]:
 
 
 def clone_repository(
-  repo_path: str, 
-  target_dir: Path, 
-  use_ssh: bool, 
-  verbose: bool
+  repo_path: str,
+  target_dir: Path,
+  use_ssh: bool,
+  verbose: bool,
+  reference: str | None = None,
+  full: bool = False
 ):
   """
   Clone a single repository.
@@ -64,19 +122,23 @@ def clone_repository(
     target_dir: Parent directory for cloning
     use_ssh: Whether to use SSH
     verbose: Whether to show verbose output
+    reference: Local mirror to borrow objects from, if configured
+    full: Clone full history instead of the default shallow clone
   """
-  repo_name = repo_path.split('/')[-1]
+  repo_name = repo_path.rpartition('/')[2]
   repo_dir = target_dir / repo_name
 
-  if repo_dir.exists():
-    print(f"\n  {repo_name} already exists")
-    return 
-  
-  print(f"\n  Cloning {repo_name}")
+  # Single write() calls keep each status line atomic when clones run
+  # concurrently; print()'s separate newline write can interleave.
+  if os.path.isdir(repo_dir):
+    sys.stdout.write(f"\n  {repo_name} already exists\n")
+    return
+
+  sys.stdout.write(f"\n  Cloning {repo_name}\n")
   repo_url = resolve_repo_url(repo_path, use_ssh)
 
   try:
-    run_command(['git', 'clone', repo_url], cwd=target_dir, verbose=verbose)
+    run_command(git_clone_command(repo_url, reference, full), cwd=target_dir, verbose=verbose, env=git_env())
   except SystemExit:
-    print(f"  Failed to clone {repo_path}")
+    sys.stdout.write(f"  Failed to clone {repo_path}\n")
     raise
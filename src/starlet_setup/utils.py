@@ -1,12 +1,29 @@
 """Utility functions for Starlet Setup."""
 
+from __future__ import annotations
+
+import os
 import sys
 import shutil
-import subprocess
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Union
 
 
+@lru_cache(maxsize=None)
+def find_tool(tool: str) -> Optional[str]:
+  """
+  Locate a tool on PATH, caching the result for repeated lookups.
+
+  Args:
+    tool: Executable name to look up
+
+  Returns:
+    Full path to the tool, or None if not found
+  """
+  return shutil.which(tool)
+
+
 def check_prerequisites(verbose: bool=False) -> None:
   """
   Check if required tools are installed.
@@ -21,7 +38,7 @@ def check_prerequisites(verbose: bool=False) -> None:
   missing = []
 
   for tool in required:
-    if not shutil.which(tool):
+    if not find_tool(tool):
       missing.append(tool)
     elif verbose:
       print(f"Found {tool}")
@@ -31,10 +48,27 @@ def check_prerequisites(verbose: bool=False) -> None:
     sys.exit(1)
 
 
+def _close_fds() -> bool:
+  """
+  Decide whether spawned commands should close inherited descriptors.
+
+  Skipping the pre-exec close-all walk is only done on Linux, and
+  setting STARLET_CLOSE_FDS forces closing even there, e.g. when the
+  parent shell or CI harness leaks descriptors.
+
+  Returns:
+    Value for subprocess's close_fds argument
+  """
+  if os.environ.get('STARLET_CLOSE_FDS'):
+    return True
+  return sys.platform != 'linux'
+
+
 def run_command(
-  cmd: list[str], 
-  cwd: Optional[Union[str, Path]] = None, 
-  verbose: bool = False
+  cmd: list[str],
+  cwd: Optional[Union[str, Path]] = None,
+  verbose: bool = False,
+  env: Optional[dict[str, str]] = None
 ) -> subprocess.CompletedProcess:
   """
   Run a shell command with proper error handling
@@ -43,6 +77,7 @@ def run_command(
     cmd: Command and arguments as list
     cwd: Working directory for command execution
     verbose: Show detailed output
+    env: Environment for the child process (inherited when None)
 
   Returns:
     CompletedProcess object
@@ -50,21 +85,28 @@ def run_command(
   Raises:
     SystemExit: If command fails
   """
+  # Deferred so commands that never spawn a process (help, config and
+  # profile management) don't pay the subprocess import at startup.
+  import subprocess
+
   if verbose:
     print(f"Running: {' '.join(cmd)}")
     if cwd:
       print(f"  in directory: {cwd}")
 
   try:
+    # Non-verbose runs discard stdout at the fd level instead of
+    # buffering it; stderr is still captured for error reporting.
     result = subprocess.run(
       cmd,
       cwd=cwd,
       check=True,
-      capture_output=not verbose,
+      env=env,
+      close_fds=_close_fds(),
+      stdout=None if verbose else subprocess.DEVNULL,
+      stderr=None if verbose else subprocess.PIPE,
       text=True
     )
-    if verbose and result.stdout:
-      print(result.stdout)
     return result
   except subprocess.CalledProcessError as e:
     print(f"Error running command: {' '.join(cmd)}")
@@ -23,6 +23,9 @@ class TestSingleRepoMode:
       clean=False,
       no_build=False,
       cmake_arg=None,
+      full_clone=False,
+      yes=False,
+      jobs=4,
       config={}
     )
 
@@ -51,6 +54,9 @@ class TestSingleRepoMode:
       clean=False,
       no_build=False,
       cmake_arg=None,
+      full_clone=False,
+      yes=False,
+      jobs=4,
       config={}
     )
 
@@ -60,6 +66,32 @@ class TestSingleRepoMode:
       assert any('pull' in str(c) for c in mock_run.call_args_list)
 
 
+  def test_yes_flag_skips_update_prompt(self, tmp_path, monkeypatch):
+    """Should update an existing repo without prompting when yes is set."""
+    monkeypatch.chdir(tmp_path)
+    repo_dir = tmp_path / "repo"
+    repo_dir.mkdir()
+
+    args = Namespace(
+      repo='user/repo',
+      ssh=False,
+      verbose=False,
+      build_dir='build',
+      build_type='Debug',
+      clean=False,
+      no_build=True,
+      cmake_arg=None,
+      full_clone=False,
+      yes=True,
+      config={}
+    )
+
+    with patch('starlet_setup.commands.run_command') as mock_run, \
+         patch('builtins.input', side_effect=AssertionError("prompt shown")):
+      single_repo_mode(args)
+      assert any('pull' in str(c) for c in mock_run.call_args_list)
+
+
   def test_skips_build_when_no_build_flag_set(self, tmp_path, monkeypatch):
     """Should skip build step when no_build is True."""
     monkeypatch.chdir(tmp_path)
@@ -72,6 +104,9 @@ class TestSingleRepoMode:
       clean=False,
       no_build=True,
       cmake_arg=None,
+      full_clone=False,
+      yes=False,
+      jobs=4,
       config={}
     )
 
@@ -94,6 +129,9 @@ class TestSingleRepoMode:
       clean=False,
       no_build=True,
       cmake_arg=None,
+      full_clone=False,
+      yes=False,
+      jobs=4,
       config={}
     )
 
@@ -120,6 +158,9 @@ class TestMonoRepoMode:
       mono_dir='mono',
       no_build=False,
       cmake_arg=None,
+      full_clone=False,
+      yes=False,
+      jobs=4,
       config={}
     )
 
@@ -146,6 +187,9 @@ class TestMonoRepoMode:
       mono_dir='mono',
       no_build=False,
       cmake_arg=None,
+      full_clone=False,
+      yes=False,
+      jobs=4,
       config=config
     )
 
@@ -167,6 +211,9 @@ class TestMonoRepoMode:
       mono_dir='mono',
       no_build=False,
       cmake_arg=None,
+      full_clone=False,
+      yes=False,
+      jobs=4,
       config={'profiles': {}}
     )
     with pytest.raises(SystemExit):
@@ -185,6 +232,9 @@ class TestMonoRepoMode:
       mono_dir='mono',
       no_build=False,
       cmake_arg=None,
+      full_clone=False,
+      yes=False,
+      jobs=4,
       config={}
     )
     
@@ -27,6 +27,14 @@ def valid_config():
 
 
 class TestLoadConfig:
+  @pytest.fixture(autouse=True)
+  def clear_cache(self):
+    """Reset the load_config cache so each test hits the filesystem."""
+    load_config.cache_clear()
+    yield
+    load_config.cache_clear()
+
+
   def test_loads_from_current_directory(self, tmp_path, valid_config, monkeypatch):
     """Should prioritize current directory config."""
     monkeypatch.chdir(tmp_path)
@@ -154,6 +162,23 @@ class TestAddConfig:
     assert 'myconfig' in config['configs']
 
 
+  def test_rewrites_loaded_config_file_in_place(self, tmp_path, monkeypatch):
+    """Should rewrite the file the config was loaded from, not the CWD."""
+    cwd = tmp_path / "workdir"
+    cwd.mkdir()
+    monkeypatch.chdir(cwd)
+    home_config = tmp_path / "home" / ".starlet-setup.json"
+    home_config.parent.mkdir()
+    home_config.write_text("{}")
+
+    config = {}
+    add_config(config, 'myconfig', {'ssh': True}, home_config)
+
+    saved = json.loads(home_config.read_text())
+    assert saved['configs']['myconfig']['ssh'] is True
+    assert not (cwd / ".starlet-setup.json").exists()
+
+
   def test_overwrites_config_when_confirmed(self):
     """Should overwrite existing config when user confirms."""
     config = {'configs': {'myconfig': {'ssh': False}}}
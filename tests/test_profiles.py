@@ -1,5 +1,6 @@
 """Tests for profiles module."""
 
+import json
 from pathlib import Path
 import pytest
 from unittest.mock import patch
@@ -34,6 +35,23 @@ class TestAddProfile:
     assert 'myprofile' in config['profiles']
 
   
+  def test_rewrites_loaded_config_file_in_place(self, tmp_path, monkeypatch):
+    """Should rewrite the file the config was loaded from, not the CWD."""
+    cwd = tmp_path / "workdir"
+    cwd.mkdir()
+    monkeypatch.chdir(cwd)
+    home_config = tmp_path / "home" / ".starlet-setup.json"
+    home_config.parent.mkdir()
+    home_config.write_text("{}")
+
+    config = {}
+    add_profile(config, ['myprofile', 'user/repo1'], home_config)
+
+    saved = json.loads(home_config.read_text())
+    assert saved['profiles']['myprofile'] == ['user/repo1']
+    assert not (cwd / ".starlet-setup.json").exists()
+
+
   def test_overwrites_existing_profile_when_confirmed(self):
     """Should overwrite existing profile when user confirms."""
     config = {'profiles': {'myprofile': ['old/repo']}}
@@ -88,6 +106,17 @@ class TestRemoveProfile:
     assert "Aborted" in capsys.readouterr().out
 
   
+  def test_assume_yes_skips_confirmation(self):
+    """Should remove without prompting when assume_yes is set."""
+    config = {'profiles': {'myprofile': ['user/repo1']}}
+
+    with patch('starlet_setup.config.save_config', return_value=Path('config.json')), \
+         patch('builtins.input', side_effect=AssertionError("prompt shown")):
+      remove_profile(config, 'myprofile', assume_yes=True)
+
+    assert 'myprofile' not in config['profiles']
+
+
   def test_handles_nonexistent_profile(self, capsys):
     """Should warn when profile doesn't exist."""
     config = {'profiles': {}}
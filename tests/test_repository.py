@@ -5,9 +5,80 @@ from unittest.mock import patch
 from starlet_setup.repository import (
     resolve_repo_url,
     get_default_repos,
-    clone_repository
+    clone_repository,
+    git_clone_command,
+    git_env
 )
 
+
+class TestGitCloneCommand:
+  def test_defaults_to_shallow_flags(self):
+    """Should emit the shallow blobless flags by default."""
+    cmd = git_clone_command("https://github.com/user/repo.git")
+
+    assert cmd[:2] == ['git', 'clone']
+    assert '--depth=1' in cmd
+    assert '--filter=blob:none' in cmd
+    assert '--no-tags' in cmd
+    assert '--single-branch' in cmd
+    assert cmd[-1] == "https://github.com/user/repo.git"
+
+
+  def test_full_clone_drops_shallow_flags(self):
+    """Should clone full history when full is requested."""
+    cmd = git_clone_command("https://github.com/user/repo.git", full=True)
+    assert cmd == ['git', 'clone', "https://github.com/user/repo.git"]
+
+
+  def test_includes_reference_when_given(self):
+    """Should borrow objects from a configured local mirror."""
+    cmd = git_clone_command("https://github.com/user/repo.git", reference="/mirrors/repo")
+
+    index = cmd.index('--reference-if-able')
+    assert cmd[index + 1] == "/mirrors/repo"
+
+
+  def test_omits_reference_when_unset(self):
+    """Should not emit --reference-if-able without a mirror."""
+    cmd = git_clone_command("https://github.com/user/repo.git")
+    assert '--reference-if-able' not in cmd
+
+
+class TestGitEnv:
+  @pytest.fixture(autouse=True)
+  def clear_cache(self):
+    """Reset the git_env cache so each test sees its own environment."""
+    git_env.cache_clear()
+    yield
+    git_env.cache_clear()
+
+
+  def test_disables_terminal_prompts(self):
+    """Should fail fast instead of prompting for credentials."""
+    assert git_env()['GIT_TERMINAL_PROMPT'] == '0'
+
+
+  def test_pins_c_locale(self, monkeypatch):
+    """Should strip locale variables and pin LC_ALL to C."""
+    monkeypatch.setenv('LANG', 'en_US.UTF-8')
+    monkeypatch.setenv('LANGUAGE', 'en_US')
+    monkeypatch.setenv('LC_MESSAGES', 'fr_FR.UTF-8')
+    git_env.cache_clear()
+
+    env = git_env()
+    assert env['LC_ALL'] == 'C'
+    assert 'LANG' not in env
+    assert 'LANGUAGE' not in env
+    assert 'LC_MESSAGES' not in env
+
+
+  def test_preserves_other_variables(self, monkeypatch):
+    """Should keep unrelated environment variables intact."""
+    monkeypatch.setenv('STARLET_TEST_VAR', 'kept')
+    git_env.cache_clear()
+
+    assert git_env()['STARLET_TEST_VAR'] == 'kept'
+
 class TestResolveRepoUrl:
   def test_returns_full_url_unchanged(self):
     """Should return full URLs as-is."""
@@ -86,6 +157,25 @@ class TestCloneRepository:
       assert 'git@github.com:user/repo.git' in command_args[0]
 
 
+  def test_uses_shallow_flags_and_git_env(self, tmp_path):
+    """Should clone with the default flags and the prepared git env."""
+    with patch('starlet_setup.repository.run_command') as mock_run:
+      clone_repository("user/repo", tmp_path, use_ssh=False, verbose=False)
+
+      command_args, command_kwargs = mock_run.call_args
+      assert '--depth=1' in command_args[0]
+      assert command_kwargs['env']['GIT_TERMINAL_PROMPT'] == '0'
+
+
+  def test_honors_full_clone(self, tmp_path):
+    """Should drop the shallow flags when full is requested."""
+    with patch('starlet_setup.repository.run_command') as mock_run:
+      clone_repository("user/repo", tmp_path, use_ssh=False, verbose=False, full=True)
+
+      command_args, _ = mock_run.call_args
+      assert command_args[0] == ['git', 'clone', 'https://github.com/user/repo.git']
+
+
   def test_raises_on_clone_failure(self, tmp_path):
     """Should propagate SystemExit when git clone fails."""
     with patch('starlet_setup.repository.run_command') as mock_run, \
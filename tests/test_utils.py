@@ -5,11 +5,20 @@ import pytest
 from unittest.mock import patch, Mock
 from starlet_setup.utils import (
     check_prerequisites,
+    find_tool,
     run_command
 )
 
 
 class TestCheckPrerequisites:
+  @pytest.fixture(autouse=True)
+  def clear_cache(self):
+    """Reset the find_tool cache so each test sees its own PATH state."""
+    find_tool.cache_clear()
+    yield
+    find_tool.cache_clear()
+
+
   def test_passes_when_tools_installed(self):
     """Should complete without error when git and cmake exist."""
     with patch('shutil.which', return_value='/usr/bin/git'):